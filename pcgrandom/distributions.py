@@ -122,9 +122,10 @@ class Distributions(object):
 
     def shuffle(self, x):
         """Shuffle list x in place, and return None."""
+        randbelow = self._randbelow
         n = len(x)
         for i in reversed(range(n)):
-            j = i + self._randbelow(n - i)
+            j = i + randbelow(n - i)
             if j > i:
                 x[i], x[j] = x[j], x[i]
 
@@ -160,9 +161,10 @@ class Distributions(object):
         # "More Programming Pearls", by Jon Bentley.  See also the post to
         # python-list dated May 28th 2010, entitled "A Friday Python
         # Programming Pearl: random sampling".
+        randbelow = self._randbelow
         position = {}
         for i in reversed(range(k)):
-            j = i + self._randbelow(n - i)
+            j = i + randbelow(n - i)
             if j in position:
                 position[i] = position[j]
             position[j] = i
@@ -189,7 +191,8 @@ class Distributions(object):
                 n = len(population)
                 if n == 0:
                     raise IndexError("Cannot choose from an empty population.")
-                return [population[self._randbelow(n)] for _ in range(k)]
+                randbelow = self._randbelow
+                return [population[randbelow(n)] for _ in range(k)]
             cum_weights, acc = [], 0
             for weight in weights:
                 acc += weight
@@ -214,8 +217,9 @@ class Distributions(object):
         # lookup. However, that shouldn't happen: self.random() is strictly
         # less than 1.0, and bisectors[-1] == 1.0, so the result of the bisect
         # call should always be strictly smaller than len(population).
+        random, bisect_right = self.random, bisect.bisect
         return [
-            population[bisect.bisect(bisectors, self.random())]
+            population[bisect_right(bisectors, random())]
             for _ in range(k)
         ]
 
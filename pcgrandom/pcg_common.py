@@ -26,6 +26,51 @@ from pcgrandom.distributions import Distributions
 from pcgrandom.seeding import seed_from_object, seed_from_system_entropy
 
 
+# Cache of jump tables, keyed by (multiplier, mask). In normal use only the
+# default multipliers appear here; the cache is cleared if it grows beyond
+# _max_jump_tables entries, to avoid unbounded growth when many custom
+# multipliers are in use.
+_jump_tables = {}
+_max_jump_tables = 16
+
+
+def _jump_table(multiplier, mask):
+    """
+    Table of coefficients for jumping an LCG ahead by powers of two.
+
+    Parameters
+    ----------
+    multiplier : integer
+        The LCG multiplier.
+    mask : integer
+        Mask for the LCG state; one less than the LCG modulus, which
+        is a power of two.
+
+    Returns
+    -------
+    table : list of pairs of integers
+        Entry k of the table is the pair (a**(2**k), 1 + a + ... +
+        a**(2**k - 1)), reduced modulo the LCG modulus, where a is the
+        multiplier. Jumping an LCG with increment c ahead by 2**k steps
+        maps state s to a**(2**k)*s + c*(1 + a + ... + a**(2**k - 1)).
+    """
+    try:
+        return _jump_tables[multiplier, mask]
+    except KeyError:
+        pass
+
+    if len(_jump_tables) >= _max_jump_tables:
+        _jump_tables.clear()
+
+    table = []
+    an, sn = multiplier, 1
+    for _ in range(mask.bit_length()):
+        table.append((an, sn))
+        an, sn = an * an & mask, sn * (an + 1) & mask
+    _jump_tables[multiplier, mask] = table
+    return table
+
+
 class PCGCommon(Distributions):
     """
     Common base class for the PCG random generators.
@@ -95,20 +140,22 @@ class PCGCommon(Distributions):
     def _advance_state(self, n):
         """Advance the underlying LCG a given number of steps."""
 
-        a, c, m = self._multiplier, self._increment, self._state_mask
+        c, m = self._increment, self._state_mask
 
         # Reduce n modulo the period of the sequence. This turns negative jumps
         # into positive ones.
         n &= m
 
-        # Left-to-right binary powering algorithm.
-        an, cn = 1, 0
-        for bit in format(n, "b"):
-            an, cn = an * an & m, an * cn + cn & m
+        # Compose the precomputed jumps for each bit that's set in n. Since
+        # all the jumps are powers of the same LCG step, the order in which
+        # they're applied doesn't matter.
+        an, sn = 1, 0
+        table = _jump_table(self._multiplier, m)
+        for bit, (ak, sk) in zip(reversed(format(n, "b")), table):
             if bit == "1":
-                an, cn = a * an & m, a * cn + c & m
+                an, sn = an * ak & m, sn * ak + sk & m
 
-        self._state = self._state * an + cn & m
+        self._state = self._state * an + c * sn & m
 
     def _next_output(self):
         """Return next output; advance the underlying LCG.
@@ -172,12 +219,12 @@ class PCGCommon(Distributions):
         if k < 0:
             raise ValueError("Number of bits should be nonnegative.")
 
-        output_bits = self._output_bits
+        output_bits, next_output = self._output_bits, self._next_output
 
         numwords, excess_bits = -(-k // output_bits), -k % output_bits
         acc = 0
         for _ in range(numwords):
-            acc = acc << output_bits | self._next_output()
+            acc = acc << output_bits | next_output()
         # int call converts small longs to ints on Python 2.
         return int(acc >> excess_bits)
 
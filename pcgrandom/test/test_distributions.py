@@ -15,6 +15,24 @@
 import unittest
 
 from pcgrandom import Random
+from pcgrandom.test.testing_utils import draw_sample
+
+
+# Distributions exercised by test_distributions_produce_floats, in the form
+# (method name, distribution parameters, sample size).
+DISTRIBUTION_CASES = [
+    ('uniform', (1.0, 2.0), 1),
+    ('normalvariate', (10.0, 5.0), 10),
+    ('lognormvariate', (10.0, 5.0), 10),
+    ('expovariate', (3.2,), 10),
+    ('vonmisesvariate', (0.0, 2.0), 20),
+    # Corner case where kappa is tiny.
+    ('vonmisesvariate', (0.0, 2e-10), 20),
+    ('gauss', (3.7, 1.3), 10),
+    ('betavariate', (0.7, 1.3), 10),
+    ('paretovariate', (0.5,), 10),
+    ('weibullvariate', (700.0, 2.5), 10),
+]
 
 
 class TestDistributions(unittest.TestCase):
@@ -24,11 +42,11 @@ class TestDistributions(unittest.TestCase):
     distribution-specific testing.
 
     """
-    def setUp(self):
-        self.gen = Random(12345)
-
-    def test_uniform(self):
-        self.assertIsInstance(self.gen.uniform(1.0, 2.0), float)
+    @classmethod
+    def setUpClass(cls):
+        # The tests only check the types of the generated values, so
+        # they can safely share a single generator.
+        cls.gen = Random(12345)
 
     def test_triangular(self):
         self.assertIsInstance(self.gen.triangular(1.0, 2.0), float)
@@ -42,30 +60,13 @@ class TestDistributions(unittest.TestCase):
         self.assertIsInstance(self.gen.triangular(1.0, 2.0, 2.0), float)
         self.assertIsInstance(self.gen.triangular(1.0, 2.0, 1.0), float)
 
-    def test_normalvariate(self):
-        sample = [self.gen.normalvariate(10.0, 5.0) for _ in range(10)]
-        for elt in sample:
-            self.assertIsInstance(elt, float)
-
-    def test_lognormvariate(self):
-        sample = [self.gen.lognormvariate(10.0, 5.0) for _ in range(10)]
-        for elt in sample:
-            self.assertIsInstance(elt, float)
-
-    def test_expovariate(self):
-        sample = [self.gen.expovariate(3.2) for _ in range(10)]
-        for elt in sample:
-            self.assertIsInstance(elt, float)
-
-    def test_vonmisesvariate(self):
-        sample = [self.gen.vonmisesvariate(0.0, 2.0) for _ in range(20)]
-        for elt in sample:
-            self.assertIsInstance(elt, float)
-
-        # Corner case where kappa is tiny.
-        sample = [self.gen.vonmisesvariate(0.0, 2e-10) for _ in range(20)]
-        for elt in sample:
-            self.assertIsInstance(elt, float)
+    def test_distributions_produce_floats(self):
+        for name, args, n in DISTRIBUTION_CASES:
+            sample = draw_sample(getattr(self.gen, name), n, *args)
+            self.assertTrue(
+                all(type(elt) is float for elt in sample),
+                msg="{0}{1!r} produced a non-float".format(name, args),
+            )
 
     def test_gammavariate(self):
         with self.assertRaises(ValueError):
@@ -75,36 +76,12 @@ class TestDistributions(unittest.TestCase):
 
         # The implementation has separate cases for alpha less than,
         # equal to, or greater than 1. Make sure we exercise all three.
-        sample = [self.gen.gammavariate(0.7, 1.3) for _ in range(10)]
-        for elt in sample:
-            self.assertIsInstance(elt, float)
+        sample = draw_sample(self.gen.gammavariate, 10, 0.7, 1.3)
+        self.assertTrue(all(type(elt) is float for elt in sample))
         # Generate enough deviates to exercise all the branches.
-        sample = [self.gen.gammavariate(0.2, 1.3) for _ in range(100)]
-        for elt in sample:
-            self.assertIsInstance(elt, float)
-        sample = [self.gen.gammavariate(1.0, 1.3) for _ in range(10)]
-        for elt in sample:
-            self.assertIsInstance(elt, float)
-        sample = [self.gen.gammavariate(1.3, 1.3) for _ in range(10)]
-        for elt in sample:
-            self.assertIsInstance(elt, float)
-
-    def test_gauss(self):
-        sample = [self.gen.gauss(3.7, 1.3) for _ in range(10)]
-        for elt in sample:
-            self.assertIsInstance(elt, float)
-
-    def test_betavariate(self):
-        sample = [self.gen.betavariate(0.7, 1.3) for _ in range(10)]
-        for elt in sample:
-            self.assertIsInstance(elt, float)
-
-    def test_paretovariate(self):
-        sample = [self.gen.paretovariate(0.5) for _ in range(10)]
-        for elt in sample:
-            self.assertIsInstance(elt, float)
-
-    def test_weibullvariate(self):
-        sample = [self.gen.weibullvariate(700.0, 2.5) for _ in range(10)]
-        for elt in sample:
-            self.assertIsInstance(elt, float)
+        sample = draw_sample(self.gen.gammavariate, 100, 0.2, 1.3)
+        self.assertTrue(all(type(elt) is float for elt in sample))
+        sample = draw_sample(self.gen.gammavariate, 10, 1.0, 1.3)
+        self.assertTrue(all(type(elt) is float for elt in sample))
+        sample = draw_sample(self.gen.gammavariate, 10, 1.3, 1.3)
+        self.assertTrue(all(type(elt) is float for elt in sample))
@@ -22,6 +22,12 @@ import itertools
 import math
 import pickle
 
+from pcgrandom.test.testing_utils import (
+    bit_counts,
+    draw_sample,
+    load_reference_words,
+)
+
 
 # 99% values of the chi-squared statistic used in the goodness-of-fit tests
 # below, indexed by degrees of freedom. Values calculated using
@@ -34,22 +40,56 @@ chisq_99percentile = {
     31: 52.19139483319192,
 }
 
+# Populations for the uniformity tests of shuffle and sample.
+PERMUTATIONS_OF_4 = list(itertools.permutations(range(4)))
+SAMPLES_OF_3_FROM_4 = list(itertools.permutations(range(4), 3))
+
 
 class TestPCGCommon(object):
     """
     Mixin class providing tests common to all generators in the
     PCG family.
+
+    Subclasses should set ``gen_class`` to the generator class under test,
+    and ``setseq_reference_data`` and ``oneseq_reference_data`` to the
+    paths of the data files containing output from the PCG reference
+    implementation for that generator, with and without an explicit
+    sequence respectively.
     """
+    @classmethod
+    def setUpClass(cls):
+        super(TestPCGCommon, cls).setUpClass()
+        cls.reference_words = {
+            'setseq': load_reference_words(cls.setseq_reference_data),
+            'oneseq': load_reference_words(cls.oneseq_reference_data),
+        }
+
+    def setUp(self):
+        self.gen = self.gen_class(seed=15206, sequence=1729)
+
+    def test_agrees_with_reference_implementation_explicit_sequence(self):
+        # Comparison with the C++ PCG reference implementation, version 0.98.
+        gen = self.gen_class(seed=42, sequence=54)
+
+        expected_words = self.reference_words['setseq']
+        actual_words = [gen._next_output() for _ in range(32)]
+        self.assertEqual(actual_words, expected_words)
+
+    def test_agrees_with_reference_implementation_unspecified_sequence(self):
+        # Comparison with the C++ PCG reference implementation, version 0.98.
+        gen = self.gen_class(seed=123)
+
+        expected_words = self.reference_words['oneseq']
+        actual_words = [gen._next_output() for _ in range(32)]
+        self.assertEqual(actual_words, expected_words)
+
     def test_creation_without_seed(self):
         gen1 = self.gen_class()
         gen2 = self.gen_class()
 
-        sample1 = [gen1.random() for _ in range(10)]
-        sample2 = [gen2.random() for _ in range(10)]
-
-        # Possible in theory for these two samples to be identical; vanishingly
-        # unlikely in practice.
-        self.assertNotEqual(sample1, sample2)
+        # Possible in theory for the two entropy-derived states to be
+        # identical; vanishingly unlikely in practice.
+        self.assertNotEqual(gen1.getstate(), gen2.getstate())
 
     def test_creation_with_seed_and_sequence(self):
         gen1 = self.gen_class(seed=12345, sequence=1)
@@ -77,34 +117,35 @@ class TestPCGCommon(object):
 
     def test_specification_of_multiplier(self):
         gen = self.gen_class(seed=123, sequence=0, multiplier=5)
+        increment, modulus = gen._increment, 2**gen._state_bits
+        old_state = gen._state
         for _ in range(10):
-            old_state = gen._state
             gen._step_state()
             new_state = gen._state
-            self.assertEqual(
-                new_state,
-                (old_state * 5 + gen._increment) % (2**gen._state_bits)
-            )
+            self.assertEqual(new_state, (old_state * 5 + increment) % modulus)
+            old_state = new_state
 
     def test_version_is_unicode(self):
         self.assertIsInstance(self.gen.VERSION, type(u''))
 
     def test_pickleability(self):
+        # Record the words following the initial state once; each recovered
+        # generator should reproduce them.
+        state = self.gen.getstate()
+        words = draw_sample(self.gen.getrandbits, 20, 10)
+
         for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.gen.setstate(state)
             pickled_gen = pickle.dumps(self.gen, protocol=protocol)
-            words = [self.gen.getrandbits(10) for _ in range(20)]
             recovered_gen = pickle.loads(pickled_gen)
-            new_words = [recovered_gen.getrandbits(10) for _ in range(20)]
-            self.assertEqual(
-                self.gen.getstate(),
-                recovered_gen.getstate(),
-            )
+            self.assertEqual(recovered_gen.getstate(), state)
+            new_words = draw_sample(recovered_gen.getrandbits, 20, 10)
             self.assertEqual(words, new_words)
 
     def test_direct_generator_output(self):
         # Direct test of _next_output method.
         nsamples = 10000
-        output_size = self.gen._output_bits
+        output_size = self.gen_class._output_bits
         samples = [self.gen._next_output() for _ in range(nsamples)]
 
         # Check that all samples are in the expected range.
@@ -112,18 +153,16 @@ class TestPCGCommon(object):
         self.assertLess(max(samples), 2**output_size)
 
         # Count number of times individual bits have appeared.
-        counts = {}
-        for bitpos in range(output_size):
-            bit = 2**bitpos
-            counts[bitpos] = sum(1 for sample in samples if (sample & bit))
+        counts = bit_counts(samples, output_size)
 
         # Assuming that each bit is "fair", each count roughly follows a normal
         # distribution with mean 0.5*nsamples and standard deviation
         # 0.5*sqrt(nsamples). We'll call a count bad if it's more than 3
         # standard deviations from the mean.
+        mean, threshold = 0.5*nsamples, 1.5*math.sqrt(nsamples)
         bad_counts = sum(
-            abs(count - 0.5*nsamples) > 1.5*math.sqrt(nsamples)
-            for count in counts.values()
+            abs(count - mean) > threshold
+            for count in counts
         )
 
         # There's about a 1 in 370 chance of any one count being bad,
@@ -136,9 +175,8 @@ class TestPCGCommon(object):
         state = gen.getstate()
         words = [gen._next_output() for _ in range(10)]
 
-        gen2 = self.gen_class()
-        gen2.setstate(state)
-        same_again = [gen2._next_output() for _ in range(10)]
+        self.gen.setstate(state)
+        same_again = [self.gen._next_output() for _ in range(10)]
         self.assertEqual(words, same_again)
 
     def test_bad_multiplier(self):
@@ -156,8 +194,8 @@ class TestPCGCommon(object):
         gen1 = self.gen_class(seed=12345, sequence=0)
         gen2 = self.gen_class(seed=12345, sequence=1)
         N = 10000
-        xs = [gen1.random() for _ in range(N)]
-        ys = [gen2.random() for _ in range(N)]
+        xs = draw_sample(gen1.random, N)
+        ys = draw_sample(gen2.random, N)
         v = sum((x - 0.5) * (y - 0.5) for x, y in zip(xs, ys)) / N
         # Check we're within 3 standard deviations of the mean.
         self.assertLess(abs(v), 0.25/math.sqrt(N))
@@ -166,14 +204,14 @@ class TestPCGCommon(object):
         # Get samples first from gen1, then from gen2.
         gen1 = self.gen_class(seed=12345, sequence=0)
         gen2 = self.gen_class(seed=12345, sequence=1)
-        sample1_1 = [gen1.random() for _ in range(10)]
-        sample2_1 = [gen2.random() for _ in range(10)]
+        sample1_1 = draw_sample(gen1.random, 10)
+        sample2_1 = draw_sample(gen2.random, 10)
 
         # Now in the opposite order: from gen2, then from gen1.
         gen1 = self.gen_class(seed=12345, sequence=0)
         gen2 = self.gen_class(seed=12345, sequence=1)
-        sample2_2 = [gen2.random() for _ in range(10)]
-        sample1_2 = [gen1.random() for _ in range(10)]
+        sample2_2 = draw_sample(gen2.random, 10)
+        sample1_2 = draw_sample(gen1.random, 10)
 
         # Now interleaved.
         gen1 = self.gen_class(seed=12345, sequence=0)
@@ -199,16 +237,16 @@ class TestPCGCommon(object):
             self.gen.setstate(bad_state)
 
     def test_save_and_restore_state(self):
-        # Generate some values.
-        [self.gen.random() for _ in range(10)]
+        # Move away from the initial state.
+        self.gen.jumpahead(10)
 
         # Save the state, generate some more.
         state = self.gen.getstate()
-        samples2 = [self.gen.random() for _ in range(10)]
+        samples2 = draw_sample(self.gen.random, 10)
 
         # Restore the state, check we get the same samples.
         self.gen.setstate(state)
-        samples3 = [self.gen.random() for _ in range(10)]
+        samples3 = draw_sample(self.gen.random, 10)
         self.assertEqual(samples2, samples3)
 
     def test_jumpahead(self):
@@ -222,9 +260,12 @@ class TestPCGCommon(object):
         same_again = [self.gen._next_output() for _ in range(1000)]
         self.assertEqual(samples, same_again)
 
-        # Now jump around randomly within the collection of samples,
-        # and check we can reproduce them.
-        positions = [self.gen.randrange(1000) for _ in range(1000)]
+        # Now visit random positions within the collection of samples, and
+        # check we can reproduce them. Visiting the positions in increasing
+        # order keeps the jumps short (and so cheap); large backward jumps
+        # are already exercised above. Repeated positions still give
+        # backward jumps of one step.
+        positions = sorted(self.gen.randrange(1000) for _ in range(1000))
 
         self.gen.setstate(original_state)
         current_pos = 0
@@ -240,6 +281,21 @@ class TestPCGCommon(object):
         self.gen.jumpahead(0)
         self.assertEqual(self.gen.getstate(), state)
 
+    def test_jumpahead_matches_stepping(self):
+        # Use a non-default multiplier, so that we exercise a jump table
+        # other than the default one.
+        gen = self.gen_class(seed=123, sequence=0, multiplier=5)
+        state = gen.getstate()
+        for n in [1, 2, 3, 37, 64, 1000]:
+            gen.setstate(state)
+            for _ in range(n):
+                gen._step_state()
+            stepped_state = gen.getstate()
+
+            gen.setstate(state)
+            gen.jumpahead(n)
+            self.assertEqual(gen.getstate(), stepped_state)
+
     def test_invertible(self):
         gen = self.gen_class(seed=12345)
         state = gen.getstate()
@@ -290,27 +346,25 @@ class TestPCGCommon(object):
 
     def test_getrandbits(self):
         k = 5
-        samples = [self.gen.getrandbits(k) for _ in range(10000)]
+        samples = draw_sample(self.gen.getrandbits, 10000, k)
         self.check_uniform(range(2**k), samples)
 
     def test_getrandbits_large(self):
         k = 101
         nsamples = 10000
-        samples = [self.gen.getrandbits(k) for _ in range(nsamples)]
+        samples = draw_sample(self.gen.getrandbits, nsamples, k)
 
         # Count number of times individual bits have appeared.
-        counts = {}
-        for bitpos in range(k):
-            bit = 2**bitpos
-            counts[bitpos] = sum(1 for sample in samples if (sample & bit))
+        counts = bit_counts(samples, k)
 
         # Assuming that each bit is "fair", each count roughly follows a normal
         # distribution with mean 0.5*nsamples and standard deviation
         # 0.5*sqrt(nsamples). We'll call a count bad if it's more than 3
         # standard deviations from the mean.
+        mean, threshold = 0.5*nsamples, 1.5*math.sqrt(nsamples)
         bad_counts = sum(
-            abs(count - 0.5*nsamples) > 1.5*math.sqrt(nsamples)
-            for count in counts.values()
+            abs(count - mean) > threshold
+            for count in counts
         )
 
         # There's about a 1 in 370 chance of any one count being bad,
@@ -340,7 +394,7 @@ class TestPCGCommon(object):
 
     def test_randrange_uniform(self):
         n = 13
-        samples = [self.gen.randrange(n) for _ in range(10000)]
+        samples = draw_sample(self.gen.randrange, 10000, n)
         self.check_uniform(range(n), samples)
 
     def test_randrange_one_doesnt_advance_state(self):
@@ -368,9 +422,9 @@ class TestPCGCommon(object):
 
     def test_randrange_start_only(self):
         # See http://bugs.python.org/issue9379 for related discussion.
-        samples = [self.gen.randrange(23) for _ in range(1000)]
-        # Chance of getting only 22 of the possible 23 outcomes is < 1.2e-18.
-        self.assertEqual(set(samples), set(range(23)))
+        # Chance of getting only 22 of the possible 23 outcomes in 1000
+        # samples is < 1.2e-18.
+        self.check_coverage(range(23), 1000, self.gen.randrange, 23)
 
         with self.assertRaises(ValueError):
             self.gen.randrange(0)
@@ -378,8 +432,7 @@ class TestPCGCommon(object):
             self.gen.randrange(-5)
 
     def test_randrange_start_and_stop(self):
-        samples = [self.gen.randrange(-10, 13) for _ in range(1000)]
-        self.assertEqual(set(samples), set(range(-10, 13)))
+        self.check_coverage(range(-10, 13), 1000, self.gen.randrange, -10, 13)
 
         with self.assertRaises(ValueError):
             self.gen.randrange(20, 20)
@@ -396,8 +449,8 @@ class TestPCGCommon(object):
         ]
 
         for test_range in test_ranges:
-            samples = [self.gen.randrange(*test_range) for _ in range(1000)]
-            self.assertEqual(set(samples), set(range(*test_range)))
+            self.check_coverage(
+                range(*test_range), 1000, self.gen.randrange, *test_range)
 
         with self.assertRaises(ValueError):
             self.gen.randrange(0, 20, 0)
@@ -419,7 +472,7 @@ class TestPCGCommon(object):
 
     def test_randint_uniform(self):
         a, b = 10, 22
-        samples = [self.gen.randint(a, b) for _ in range(10000)]
+        samples = draw_sample(self.gen.randint, 10000, a, b)
         self.check_uniform(range(a, b+1), samples)
 
     def test_randint_empty_range(self):
@@ -449,9 +502,11 @@ class TestPCGCommon(object):
         self.check_uniform(seq, choices)
 
     def test_sample(self):
-        samples = [tuple(self.gen.sample(range(4), 3)) for _ in range(10000)]
-        population = list(itertools.permutations(range(4), 3))
-        self.check_uniform(population, samples)
+        samples = [
+            tuple(sample)
+            for sample in draw_sample(self.gen.sample, 10000, range(4), 3)
+        ]
+        self.check_uniform(SAMPLES_OF_3_FROM_4, samples)
 
     def test_sample_set(self):
         s = set('ABCDEFG')
@@ -485,10 +540,7 @@ class TestPCGCommon(object):
             self.gen.shuffle(population)
             samples.append(tuple(population))
 
-        self.check_uniform(
-            list(itertools.permutations(range(4))),
-            samples,
-        )
+        self.check_uniform(PERMUTATIONS_OF_4, samples)
 
     def test_shuffle_corner_cases(self):
         # shuffling a length 0 or 1 sequence shouldn't be a problem
@@ -565,12 +617,37 @@ class TestPCGCommon(object):
             self.gen.choices(range(3), cum_weights=[0.0, 0.0, 0.0])
 
     def test_random_uniformity(self):
-        sample = [self.gen.random() for _ in range(10000)]
+        sample = draw_sample(self.gen.random, 10000)
 
         # Bin and do a chi-squared test.
         binned_sample = [int(13*x) for x in sample]
         self.check_uniform(range(13), binned_sample)
 
+    def check_coverage(self, population, max_draws, distribution, *args):
+        """
+        Check that every member of a population can be generated.
+
+        Draws from the given distribution until every member of the
+        population has been seen, failing if that doesn't happen within
+        *max_draws* draws, or if something outside the population is drawn.
+
+        Parameters
+        ----------
+        population : iterable
+            The expected set of possible outcomes.
+        max_draws : positive integer
+            Maximum number of draws to make.
+        distribution : callable
+            Method to draw from, called as distribution(*args).
+        """
+        population = set(population)
+        seen = set()
+        for _ in range(max_draws):
+            seen.add(distribution(*args))
+            if len(seen) >= len(population):
+                break
+        self.assertEqual(seen, population)
+
     def check_uniform(self, population, sample):
         """
         Check uniformity via a chi-squared test with p-value 0.99.
@@ -610,8 +687,9 @@ class TestPCGCommon(object):
         # generated.
         self.assertLessEqual(set(counts), set(expected))
 
+        critical_value = chisq_99percentile[len(expected)-1]
         stat = sum(
-            (counts[i] - expected[i])**2 / expected[i]
-            for i in expected
+            (counts[i] - expected_count)**2 / expected_count
+            for i, expected_count in expected.items()
         )
-        self.assertLess(stat, chisq_99percentile[len(expected)-1])
+        self.assertLess(stat, critical_value)
@@ -15,35 +15,22 @@
 """
 Tests for the PCG_XSL_RR_V0 generator.
 """
-import pkgutil
 import unittest
 
-from pcgrandom.pcg_xsl_rr_v0 import PCG_XSL_RR_V0
+from pcgrandom.pcg_xsl_rr_v0 import PCG_XSL_RR_V0, _rotate64
 from pcgrandom.test.test_pcg_common import TestPCGCommon
 
 
 class Test_PCG_XSL_RR_V0(TestPCGCommon, unittest.TestCase):
     gen_class = PCG_XSL_RR_V0
-
-    def setUp(self):
-        self.gen = self.gen_class(seed=15206, sequence=1729)
-
-    def test_agrees_with_reference_implementation_explicit_sequence(self):
-        # Comparison with the C++ PCG reference implementation, version 0.98.
-        gen = self.gen_class(seed=42, sequence=54)
-
-        expected_raw = pkgutil.get_data(
-            'pcgrandom.test', 'data/setseq_xsl_rr_128_64.txt')
-        expected_words = expected_raw.decode('utf-8').splitlines(False)
-        actual_words = [format(gen._next_output(), '#018x') for _ in range(32)]
-        self.assertEqual(actual_words, expected_words)
-
-    def test_agrees_with_reference_implementation_unspecified_sequence(self):
-        # Comparison with the C++ PCG reference implementation, version 0.98.
-        gen = self.gen_class(seed=123)
-
-        expected_raw = pkgutil.get_data(
-            'pcgrandom.test', 'data/oneseq_xsl_rr_128_64.txt')
-        expected_words = expected_raw.decode('utf-8').splitlines(False)
-        actual_words = [format(gen._next_output(), '#018x') for _ in range(32)]
-        self.assertEqual(actual_words, expected_words)
+    setseq_reference_data = 'data/setseq_xsl_rr_128_64.txt'
+    oneseq_reference_data = 'data/oneseq_xsl_rr_128_64.txt'
+
+    def test_rotate64(self):
+        # A rotation by zero leaves the low 64 bits unchanged.
+        value = 0x0123456789abcdef
+        self.assertEqual(_rotate64(value, 0), value)
+        self.assertEqual(_rotate64(2**64 + value, 0), value)
+        self.assertEqual(_rotate64(value, 4), 0xf0123456789abcde)
+        self.assertEqual(_rotate64(1, 1), 2**63)
+        self.assertEqual(_rotate64(2**64 - 2, 63), 2**64 - 3)
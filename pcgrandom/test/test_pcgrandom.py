@@ -40,12 +40,10 @@ class TestPCGRandom(unittest.TestCase):
         [gen.random() for _ in range(10)]
 
     def test_pcg_32(self):
-        gen = pcgrandom.PCG32()
-        self.assertEqual(gen._output_bits, 32)
+        self.assertEqual(pcgrandom.PCG32._output_bits, 32)
 
     def test_pcg_64(self):
-        gen = pcgrandom.PCG64()
-        self.assertEqual(gen._output_bits, 64)
+        self.assertEqual(pcgrandom.PCG64._output_bits, 64)
 
     def test_float_generators(self):
         # Just exercise the float generators to make sure that they're usable.
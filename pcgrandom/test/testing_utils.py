@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import contextlib
+import pkgutil
 import sys
 
 
@@ -27,3 +28,58 @@ def args_in_sys_argv(args):
         yield
     finally:
         sys.argv = old_sys_argv
+
+
+def bit_counts(values, bits):
+    """
+    Count how often each bit position is set in a collection of values.
+
+    Parameters
+    ----------
+    values : iterable of nonnegative integers
+        The values to examine. Each value should be smaller than 2**bits.
+    bits : positive integer
+        Number of bit positions to count.
+
+    Returns
+    -------
+    counts : list of int
+        List of length *bits*; counts[i] is the number of values
+        in which bit i (the bit with value 2**i) is set.
+    """
+    # Write all the values out as a single string of fixed-width binary
+    # representations. Each bit position then corresponds to a slice of that
+    # string with stride *bits*, and the counting happens at C speed.
+    binary_format = '0{0}b'.format(bits)
+    digits = ''.join([format(value, binary_format) for value in values])
+    return [
+        digits[bits - 1 - bitpos::bits].count('1')
+        for bitpos in range(bits)
+    ]
+
+
+def draw_sample(distribution, n, *args):
+    """
+    Draw a sample of size n from the given distribution method,
+    using args as the distribution parameters.
+    """
+    return [distribution(*args) for _ in range(n)]
+
+
+def load_reference_words(filename):
+    """
+    Load output words produced by the PCG reference implementation.
+
+    Parameters
+    ----------
+    filename : str
+        Path to the data file, relative to the pcgrandom.test package.
+        The file should contain one hexadecimal word per line.
+
+    Returns
+    -------
+    words : list of int
+        The words from the data file, in order.
+    """
+    raw = pkgutil.get_data('pcgrandom.test', filename)
+    return [int(word, 16) for word in raw.decode('utf-8').splitlines(False)]